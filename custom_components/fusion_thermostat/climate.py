@@ -1,4 +1,5 @@
 import logging, asyncio
+from time import monotonic
 
 from homeassistant.const import (CONF_NAME,  UnitOfTemperature)
 from homeassistant.components.climate import PLATFORM_SCHEMA, ClimateEntity, HVACMode, ClimateEntityFeature, HVACAction
@@ -6,10 +7,9 @@ from homeassistant.components.climate import PLATFORM_SCHEMA, ClimateEntity, HVA
 import voluptuous as vol
 import homeassistant.helpers.config_validation as cv
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.reload import async_setup_reload_service
 
 from homeassistant.helpers.restore_state import RestoreEntity
 
@@ -23,6 +23,8 @@ from . import DOMAIN, PLATFORMS
 # Create Logger
 _LOGGER = logging.getLogger(__name__)
 
+_BAD_STATES = frozenset((None, "unknown", "unavailable"))
+
 CONF_TEMPERATURE_ENTITY_ID = "target_sensor"
 CONF_REAL_THERMOSTATS = "real_thermostats"
 CONF_WINDOWS_SENSOR = "windows_sensor"
@@ -79,6 +81,9 @@ async def async_setup_platform(hass: HomeAssistant, config: ConfigType, async_ad
     """
     _LOGGER.debug("Setting up FusionThermostat platform")
     try:
+        # Nur hier gebraucht, daher erst beim Setup importiert
+        from homeassistant.helpers.reload import async_setup_reload_service
+
         # Registriert den Reload-Service für diese Integration
         await async_setup_reload_service(hass, DOMAIN, PLATFORMS)
 
@@ -104,93 +109,136 @@ async def async_setup_platform(hass: HomeAssistant, config: ConfigType, async_ad
 
 class FusionThermostat(ClimateEntity, RestoreEntity):
     def __init__(self, name, temperature_entity_id, real_thermostats, windows_sensor, window_delay, min_temp, max_temp, hot_tolerance, cold_tolerance, calibration_value, test_server):
-        self._name = name
-        self._unique_id = f"{self._name}_{DOMAIN}"
-        self._temperature_unit = UnitOfTemperature.CELSIUS
-        self._target_temperature = 20
+        self._attr_name = name
+        self._attr_unique_id = f"{self._attr_name}_{DOMAIN}"
+        self._attr_temperature_unit = UnitOfTemperature.CELSIUS
+        self._attr_target_temperature = 20
         self._real_thermostats = real_thermostats
         self._windows_sensor = windows_sensor
-        self._min_temp = min_temp
-        self._max_temp = max_temp
+        self._attr_min_temp = min_temp
+        self._attr_max_temp = max_temp
         self._hot_tolerance = hot_tolerance
         self._cold_tolerance = cold_tolerance
         self._calibration_value = calibration_value
         self._local_temperature_calibration = 0
-        self._hvac_mode = HVACMode.HEAT
-        self._hvac_modes = [HVACMode.OFF, HVACMode.HEAT]
-        self._hvac_action = HVACAction.HEATING
-        self._supported_features = (
+        self._last_calibration = {}
+        self._attr_hvac_mode = HVACMode.HEAT
+        self._attr_hvac_modes = [HVACMode.OFF, HVACMode.HEAT]
+        self._attr_hvac_action = HVACAction.HEATING
+        self._attr_supported_features = (
             ClimateEntityFeature.TARGET_TEMPERATURE |
             ClimateEntityFeature.TURN_ON |
             ClimateEntityFeature.TURN_OFF
         )
-        self._current_temperature = 10
+        self._attr_current_temperature = 10
         self._temperature_entity_id = temperature_entity_id
         self._call_delay = 0.5
+        self._device_locks = {}
+        self._last_call_ts = {}
+        self._control_debounce_delay = 2.0
+        self._control_debounce_handle = None
         self._window_delay = window_delay
-        self._is_updating_real_thermostats = False
+        self._pending_echoes = set()
+        self._pending_mode = None
         self._cancel_call = None
         self._test_server = test_server
+        # Die Kalibrierungs-Entity-IDs einmalig ableiten statt bei jedem Aufruf
+        self._calibration_domain = "input_number" if test_server else "number"
+        self._calibration_entity_ids = {
+            entity_id: f"{self._calibration_domain}.{entity_id.split('.')[1]}_local_temperature_calibration"
+            for entity_id in real_thermostats
+        }
 
     async def async_added_to_hass(self):
         """Handle entity which will be added."""
         await super().async_added_to_hass()
 
-        # Add listener
-        # External temperature sensor
-        self.async_on_remove(
-            async_track_state_change_event(
-                self.hass, [self._temperature_entity_id], self._async_sensor_changed
-            )
-        )
-        # Real thermostat
+        # Add a single listener over all tracked entities and dispatch
+        # internally, instead of one listener per entity group.
+        self._dispatch = {
+            self._temperature_entity_id: self._async_sensor_changed,
+            **{target: self._async_thermostat_changed for target in self._real_thermostats},
+        }
+        if self._windows_sensor and len(self._windows_sensor) > 0:
+            self._dispatch[self._windows_sensor] = self._async_windows_changed
+
+        @callback
+        def _async_tracked_entity_changed(event):
+            self._dispatch[event.data["entity_id"]](event)
+
         self.async_on_remove(
             async_track_state_change_event(
-                self.hass, self._real_thermostats, self._async_thermostat_changed
+                self.hass, list(self._dispatch), _async_tracked_entity_changed
             )
         )
-        # Window contact
-        if self._windows_sensor and len(self._windows_sensor) > 0:
-            self.async_on_remove(
-                async_track_state_change_event(
-                    self.hass, [self._windows_sensor], self._async_windows_changed
-                )
-            )
 
         last_state = await self.async_get_last_state()
         if last_state is not None and last_state.state is not None:
-            self._hvac_mode = last_state.state
-            self._hvac_action = last_state.attributes.get("hvac_action", self._hvac_action)
-            self._target_temperature = last_state.attributes.get("temperature", self._target_temperature)
-            self._current_temperature = last_state.attributes.get("current_temperature", self._current_temperature)
+            # Restore enums, not raw strings, so comparisons against
+            # HVACMode/HVACAction members keep working.
+            try:
+                self._attr_hvac_mode = HVACMode(last_state.state)
+            except ValueError:
+                _LOGGER.warning("Ignoring invalid restored HVAC mode '%s' for %s", last_state.state, self.name)
+            restored_action = last_state.attributes.get("hvac_action")
+            if restored_action is not None:
+                try:
+                    self._attr_hvac_action = HVACAction(restored_action)
+                except ValueError:
+                    _LOGGER.warning("Ignoring invalid restored HVAC action '%s' for %s", restored_action, self.name)
+            self._attr_target_temperature = last_state.attributes.get("temperature", self._attr_target_temperature)
+            self._attr_current_temperature = last_state.attributes.get("current_temperature", self._attr_current_temperature)
             _LOGGER.debug("Restored state for %s: hvac_mode=%s, hvac_action=%s, target_temperature=%s, current_temperature=%s",
-                          self.name, self._hvac_mode, self._hvac_action, self._target_temperature, self._current_temperature)
-
-    async def async_set_hvac_mode(self, hvac_mode: str) -> None:
-        """Set new target hvac mode."""
+                          self.name, self._attr_hvac_mode, self._attr_hvac_action, self._attr_target_temperature, self._attr_current_temperature)
+
+    async def async_will_remove_from_hass(self):
+        """Cancel pending timers when the entity is removed."""
+        if self._control_debounce_handle is not None:
+            self._control_debounce_handle()
+            self._control_debounce_handle = None
+        if self._cancel_call is not None:
+            self._cancel_call()
+            self._cancel_call = None
+        self._pending_mode = None
+        await super().async_will_remove_from_hass()
+
+    async def async_set_hvac_mode(self, hvac_mode: str, trigger_entity_id=None) -> None:
+        """Set new target hvac mode.
+
+        When the change originated from one of the real thermostats, pass its
+        entity_id as trigger_entity_id so it is skipped in the fanout.
+        """
         try:
             _LOGGER.debug("Attempting to set HVAC mode to %s for %s", hvac_mode, self.name)
 
-            if self._hvac_modes is None:
+            if self._attr_hvac_modes is None:
                 _LOGGER.error("HVAC modes are None for %s. Cannot set mode.", self.name)
                 return
 
-            if hvac_mode in self._hvac_modes:
-                self._hvac_mode = hvac_mode
+            if hvac_mode in self._attr_hvac_modes:
+                self._attr_hvac_mode = hvac_mode
                 _LOGGER.debug("HVAC mode successfully set to %s for %s", hvac_mode, self.name)
-                if self._hvac_mode == HVACMode.OFF:
-                    self._hvac_action = HVACAction.OFF
-                    self.async_write_ha_state()
-                elif self._hvac_mode == HVACMode.HEAT:
-                    self._hvac_action = HVACAction.HEATING
-                    self.async_write_ha_state()
+                if self._attr_hvac_mode == HVACMode.OFF:
+                    self._attr_hvac_action = HVACAction.OFF
+                elif self._attr_hvac_mode == HVACMode.HEAT:
+                    self._attr_hvac_action = HVACAction.HEATING
                     await self._async_control_heating()
-                for target in self._real_thermostats:
-                    await self._async_real_thermostats_set_hvac_mode(hvac_mode=hvac_mode, entity_id=target, delay=self._call_delay)
+                # Einmal schreiben, bevor die Geräteaufrufe im Hintergrund laufen
+                self.async_write_ha_state()
+                # Fire and forget, damit die Bedienoberfläche sofort reagiert
+                self.hass.async_create_task(
+                    self._async_call_real_thermostats(
+                        self._async_real_thermostats_set_hvac_mode(hvac_mode=hvac_mode, entity_id=target, delay=self._call_delay)
+                        for target in self._real_thermostats
+                        if target != trigger_entity_id
+                    ),
+                    name=f"fusion_set_hvac_mode_{self._attr_name}",
+                    eager_start=True,
+                )
             else:
                 _LOGGER.warning(
                     "Invalid HVAC mode '%s' for %s. Supported modes are: %s",
-                    hvac_mode, self.name, self._hvac_modes
+                    hvac_mode, self.name, self._attr_hvac_modes
                 )
         except Exception as e:
             _LOGGER.error("Error setting HVAC mode for %s: %s", self.name, e, exc_info=True)
@@ -198,34 +246,57 @@ class FusionThermostat(ClimateEntity, RestoreEntity):
     async def async_set_temperature(self, **kwargs) -> None:
         """Set new target temperature."""
         temp = kwargs.get('temperature')
+        trigger_entity_id = kwargs.get('trigger_entity_id')
         if temp is not None:
-            self._target_temperature = temp
+            self._attr_target_temperature = temp
             _LOGGER.debug("Target temperature set to %s°C for %s", temp, self.name)
-            if self._hvac_mode == HVACMode.HEAT:
+            if self._attr_hvac_mode == HVACMode.HEAT:
                 await self._async_control_heating()
             self.async_write_ha_state()
-            for target in self._real_thermostats:
-                await self._async_real_thermostats_set_temperature(temperature=temp, entity_id=target, delay=self._call_delay)
+            # Fire and forget, damit die Bedienoberfläche sofort reagiert
+            self.hass.async_create_task(
+                self._async_call_real_thermostats(
+                    self._async_real_thermostats_set_temperature(temperature=temp, entity_id=target, delay=self._call_delay)
+                    for target in self._real_thermostats
+                    if target != trigger_entity_id
+                ),
+                name=f"fusion_set_temperature_{self._attr_name}",
+                eager_start=True,
+            )
         else:
             _LOGGER.warning("No temperature provided to set for %s", self.name)
 
-    async def _async_sensor_changed(self, event) -> None:
+    @callback
+    def _async_sensor_changed(self, event) -> None:
         """Handle temperature changes from the sensor."""
         new_state = event.data.get("new_state")
-        if new_state is None or new_state.state in (None, "unknown", "unavailable"):
+        if new_state is None or new_state.state in _BAD_STATES:
             return
 
         try:
-            self._current_temperature = float(new_state.state)
+            self._attr_current_temperature = float(new_state.state)
             _LOGGER.debug("Current temperature updated to %s°C from sensor %s", new_state.state, self._temperature_entity_id)
-            if self._hvac_mode == HVACMode.HEAT:
-                await self._async_control_heating()
+            if self._attr_hvac_mode == HVACMode.HEAT:
+                # Coalesce bursts of sensor updates into one control run
+                if self._control_debounce_handle is not None:
+                    self._control_debounce_handle()
+                self._control_debounce_handle = async_call_later(
+                    self.hass, self._control_debounce_delay, self._async_debounced_control
+                )
             self.async_write_ha_state()
         except ValueError:
             _LOGGER.error("Failed to parse temperature from sensor %s: %s", self._temperature_entity_id, new_state.state)
 
+    async def _async_debounced_control(self, _):
+        """Run the control loop for the latest sensor reading in the debounce window."""
+        self._control_debounce_handle = None
+        await self._async_control_heating()
+        # Den entschiedenen hvac_action-Wert auch in den Zustand übernehmen
+        self.async_write_ha_state()
 
-    async def _async_windows_changed(self, event):
+
+    @callback
+    def _async_windows_changed(self, event):
         """Handle window changes."""
         new_state = event.data.get("new_state")
         old_state = event.data.get("old_state")
@@ -233,77 +304,98 @@ class FusionThermostat(ClimateEntity, RestoreEntity):
         if new_state is None or old_state is None or new_state.state == old_state.state:
             return
 
-        # Fenster geschlossen (state: "off")
-        if new_state.state == "off":
+        # Fenster geöffnet (state: "on") -> Ausschalten, geschlossen (state: "off") -> Einschalten
+        if new_state.state == "on":
+            _LOGGER.info("Fenster geöffnet erkannt.")
+            desired_mode = HVACMode.OFF
+        elif new_state.state == "off":
             _LOGGER.info("Fenster geschlossen erkannt.")
-            if self._cancel_call:
-                _LOGGER.info("Abbrechen der Verzögerung für das Ausschalten, da Fenster geschlossen wurde.")
-                self._cancel_call()
-                self._cancel_call = None
-            else:
-                _LOGGER.info("Starten der Verzögerung für das Einschalten der Heizung.")
-                self._cancel_call = async_call_later(
-                    self.hass, self._window_delay, self._async_set_hvac_mode_heat
-                )
+            desired_mode = HVACMode.HEAT
+        else:
+            return
 
-        # Fenster geöffnet (state: "on")
-        elif new_state.state == "on":
-            _LOGGER.info("Fenster geöffnet erkannt.")
-            if self._cancel_call:
-                _LOGGER.info("Abbrechen der Verzögerung für das Einschalten, da Fenster geöffnet wurde.")
-                self._cancel_call()
-                self._cancel_call = None
-            else:
-                _LOGGER.info("Starten der Verzögerung für das Ausschalten der Heizung.")
-                self._cancel_call = async_call_later(
-                    self.hass, self._window_delay, self._async_set_hvac_mode_off
-                )
+        if self._cancel_call:
+            self._cancel_call()
+            self._cancel_call = None
 
-    async def _async_thermostat_changed(self, event) -> None:
-        """Handle changes from real thermostats."""
-        if self._is_updating_real_thermostats:  # Überspringe, wenn eine eigene Änderung läuft
-            _LOGGER.debug("Skipping _async_thermostat_changed due to self-trigger.")
+        if desired_mode == self._attr_hvac_mode:
+            _LOGGER.info("Fensterzustand passt wieder zum aktuellen Modus, Verzögerung verworfen.")
+            self._pending_mode = None
             return
 
+        _LOGGER.info("Starten der Verzögerung für den Wechsel auf %s.", desired_mode)
+        self._pending_mode = desired_mode
+        self._cancel_call = async_call_later(
+            self.hass, self._window_delay, self._async_apply_pending_mode
+        )
+
+    async def _async_apply_pending_mode(self, _):
+        """Apply the HVAC mode scheduled by the window handler."""
+        self._cancel_call = None
+        pending_mode = self._pending_mode
+        self._pending_mode = None
+        if pending_mode is not None:
+            await self.async_set_hvac_mode(pending_mode)
+
+    @callback
+    def _async_thermostat_changed(self, event) -> None:
+        """Handle changes from real thermostats."""
         try:
-            trigger_entity_id = event.data.get("entity_id")
-            old_state = event.data.get("old_state")
-            new_state = event.data.get("new_state")
+            data = event.data
+            trigger_entity_id = data["entity_id"]
+            old_state = data["old_state"]
+            new_state = data["new_state"]
 
-            if new_state is None or new_state.state in (None, "unknown", "unavailable") or old_state is None or old_state.state in (None, "unknown", "unavailable"):
+            if new_state is None or old_state is None or new_state.state in _BAD_STATES or old_state.state in _BAD_STATES:
                 return
 
+            new_attributes = new_state.attributes
+            old_attributes = old_state.attributes
+
             # Check if target temperature changed
-            new_target_temp = new_state.attributes.get("temperature")
-            old_target_temp = old_state.attributes.get("temperature")
+            new_target_temp = new_attributes.get("temperature")
+            old_target_temp = old_attributes.get("temperature")
             if old_target_temp != new_target_temp:
-                await self.async_set_temperature(temperature=new_target_temp)
-                for entity_id in self._real_thermostats:
-                    if entity_id != trigger_entity_id:
-                        await self._async_real_thermostats_set_temperature(temperature=new_target_temp, entity_id=entity_id, delay=self._call_delay)
+                echo = (trigger_entity_id, "temperature", new_target_temp)
+                if echo in self._pending_echoes:
+                    # Überspringe, wenn es sich um das Echo einer eigenen Änderung handelt
+                    self._pending_echoes.discard(echo)
+                    _LOGGER.debug("Skipping self-triggered temperature change from %s.", trigger_entity_id)
+                else:
+                    self.hass.async_create_task(
+                        self.async_set_temperature(temperature=new_target_temp, trigger_entity_id=trigger_entity_id)
+                    )
 
             # Check if HVAC mode changed
             new_hvac_mode = new_state.state
             old_hvac_mode = old_state.state
             if new_hvac_mode != old_hvac_mode:
-                if new_hvac_mode in self._hvac_modes:
-                    await self.async_set_hvac_mode(new_hvac_mode)
-                    for entity_id in self._real_thermostats:
-                        if entity_id != trigger_entity_id:
-                            await self._async_real_thermostats_set_hvac_mode(hvac_mode=new_hvac_mode, entity_id=entity_id, delay=self._call_delay)
+                echo = (trigger_entity_id, "hvac_mode", new_hvac_mode)
+                if echo in self._pending_echoes:
+                    self._pending_echoes.discard(echo)
+                    _LOGGER.debug("Skipping self-triggered HVAC mode change from %s.", trigger_entity_id)
+                elif new_hvac_mode in self._attr_hvac_modes:
+                    self.hass.async_create_task(
+                        self.async_set_hvac_mode(new_hvac_mode, trigger_entity_id=trigger_entity_id)
+                    )
         except Exception as e:
             _LOGGER.error("Error in _async_thermostat_changed: %s", e, exc_info=True)
 
     async def _async_control_heating(self) -> None:
-        current_temp = self._current_temperature
-        target_temp = self._target_temperature
+        # Nichts regeln, solange die Entity nicht registriert oder die Heizung aus ist
+        if self.hass is None or self._attr_hvac_mode != HVACMode.HEAT:
+            _LOGGER.debug("Skipping control run for %s: not ready or not in HEAT mode", self._attr_name)
+            return
+
+        current_temp = self._attr_current_temperature
+        target_temp = self._attr_target_temperature
 
         if current_temp is None or target_temp is None:
             _LOGGER.error(
                 "Cannot control heating: current temperature or target temperature is None. "
                 "Current: %s, Target: %s", current_temp, target_temp
             )
-            self._hvac_action = None
+            self._attr_hvac_action = None
             return
 
         heating_demand = target_temp - current_temp
@@ -333,125 +425,100 @@ class FusionThermostat(ClimateEntity, RestoreEntity):
                 current_temp, target_temp, heating_demand, self._cold_tolerance, self._hot_tolerance
             )
 
-    async def _async_set_hvac_mode_heat(self, _):
-        hvac_mode = HVACMode.HEAT
-        self._hvac_mode = hvac_mode
-        await self.async_set_hvac_mode(hvac_mode)
-        self._cancel_call = None
-
-    async def _async_set_hvac_mode_off(self, _):
-        hvac_mode = HVACMode.OFF
-        await self.async_set_hvac_mode(hvac_mode)
-        self._cancel_call = None
-
     async def _async_set_hvac_action_heating(self):
-        self._hvac_action = HVACAction.HEATING
-        for target in self._real_thermostats:
-            await self._async_real_thermostat_set_calibration(calibration_value=-self._calibration_value, entity_id=target, delay=self._call_delay)
+        await self._async_apply_hvac_action(HVACAction.HEATING, -self._calibration_value)
 
     async def _async_set_hvac_action_off(self):
-        self._hvac_action = HVACAction.OFF
-        for target in self._real_thermostats:
-            await self._async_real_thermostat_set_calibration(calibration_value=0, entity_id=target, delay=self._call_delay)
+        await self._async_apply_hvac_action(HVACAction.OFF, 0)
 
     async def _async_set_hvac_action_idle(self):
-        self._hvac_action = HVACAction.IDLE
-        for target in self._real_thermostats:
-            await self._async_real_thermostat_set_calibration(calibration_value=self._calibration_value, entity_id=target, delay=self._call_delay)
+        await self._async_apply_hvac_action(HVACAction.IDLE, self._calibration_value)
+
+    async def _async_apply_hvac_action(self, hvac_action, calibration_value):
+        """Apply a heating decision, only writing calibrations that actually change."""
+        self._attr_hvac_action = hvac_action
+        targets = [
+            target for target in self._real_thermostats
+            if self._last_calibration.get(target) != calibration_value
+        ]
+        if not targets:
+            _LOGGER.debug("HVAC action %s already applied for %s, skipping calibration writes", hvac_action, self.name)
+            return
+        await self._async_call_real_thermostats(
+            self._async_real_thermostat_set_calibration(calibration_value=calibration_value, entity_id=target, delay=self._call_delay)
+            for target in targets
+        )
+
+    async def _async_call_real_thermostats(self, coros) -> None:
+        """Run the per-thermostat service calls concurrently so the delays overlap."""
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                _LOGGER.error("Error calling real thermostat for %s: %s", self.name, result)
+
+    async def _async_wait_for_device_slot(self, entity_id, delay) -> None:
+        """Sleep only as long as needed to keep `delay` seconds between calls to a device."""
+        last_call = self._last_call_ts.get(entity_id)
+        if last_call is not None:
+            wait = delay - (monotonic() - last_call)
+            if wait > 0:
+                _LOGGER.debug(f"Verzögerung von {wait:.2f} Sekunden für {entity_id}.")
+                await asyncio.sleep(wait)
 
     async def _async_real_thermostats_set_hvac_mode(self, hvac_mode, entity_id, delay) -> None:
-        self._is_updating_real_thermostats = True
-        try:
-            if delay > 0:
-                _LOGGER.debug(f"Verzögerung von {delay} Sekunden.")
-                await asyncio.sleep(delay)
-            await self.hass.services.async_call(
-                "climate", "set_hvac_mode", {"entity_id": entity_id, "hvac_mode": hvac_mode},
-            )
-            _LOGGER.debug("HVAC mode set to %s for real Thermostat %s", hvac_mode, entity_id)
-        finally:
-            self._is_updating_real_thermostats = False
+        async with self._device_locks.setdefault(entity_id, asyncio.Lock()):
+            # Kein Aufruf und kein Echo, wenn das Gerät den Wert schon hat
+            current = self.hass.states.get(entity_id)
+            if current is not None and current.state == hvac_mode:
+                _LOGGER.debug("Real Thermostat %s is already in HVAC mode %s, skipping", entity_id, hvac_mode)
+                return
+            await self._async_wait_for_device_slot(entity_id, delay)
+            echo = (entity_id, "hvac_mode", hvac_mode)
+            self._pending_echoes.add(echo)
+            try:
+                await self.hass.services.async_call(
+                    "climate", "set_hvac_mode", {"entity_id": entity_id, "hvac_mode": hvac_mode},
+                )
+            except Exception:
+                # Kein Echo zu erwarten, wenn der Aufruf fehlgeschlagen ist
+                self._pending_echoes.discard(echo)
+                raise
+            self._last_call_ts[entity_id] = monotonic()
+        _LOGGER.debug("HVAC mode set to %s for real Thermostat %s", hvac_mode, entity_id)
 
     async def _async_real_thermostats_set_temperature(self, temperature, entity_id, delay) -> None:
-        self._is_updating_real_thermostats = True
-        try:
-            if delay > 0:
-                _LOGGER.debug(f"Verzögerung von {delay} Sekunden.")
-                await asyncio.sleep(delay)
-            await self.hass.services.async_call(
-                "climate", "set_temperature", {"entity_id": entity_id, "temperature": temperature},
-            )
-            _LOGGER.debug("Target temperature set to %s°C for real Thermostat %s", temperature, entity_id)
-        finally:
-            self._is_updating_real_thermostats = False
+        async with self._device_locks.setdefault(entity_id, asyncio.Lock()):
+            current = self.hass.states.get(entity_id)
+            if current is not None and current.attributes.get("temperature") == temperature:
+                _LOGGER.debug("Real Thermostat %s is already at %s°C, skipping", entity_id, temperature)
+                return
+            await self._async_wait_for_device_slot(entity_id, delay)
+            echo = (entity_id, "temperature", temperature)
+            self._pending_echoes.add(echo)
+            try:
+                await self.hass.services.async_call(
+                    "climate", "set_temperature", {"entity_id": entity_id, "temperature": temperature},
+                )
+            except Exception:
+                self._pending_echoes.discard(echo)
+                raise
+            self._last_call_ts[entity_id] = monotonic()
+        _LOGGER.debug("Target temperature set to %s°C for real Thermostat %s", temperature, entity_id)
 
     async def _async_real_thermostat_set_calibration(self, calibration_value, entity_id, delay) -> None:
-        if delay > 0:
-            _LOGGER.debug(f"Verzögerung von {delay} Sekunden.")
-            await asyncio.sleep(delay)
-        if self._test_server:
-            calibration_entity_id = f"input_number.{entity_id.split(".")[1]}_local_temperature_calibration"
-            self._local_temperature_calibration = calibration_value
-            await self.hass.services.async_call(domain="input_number", service="set_value", service_data={"entity_id": calibration_entity_id,"value": calibration_value})
-        else:
-            calibration_entity_id = f"number.{entity_id.split(".")[1]}_local_temperature_calibration"
-            self._local_temperature_calibration = calibration_value
-            await self.hass.services.async_call(domain="number", service="set_value", service_data={"entity_id": calibration_entity_id,"value": calibration_value})
+        async with self._device_locks.setdefault(entity_id, asyncio.Lock()):
+            await self._async_wait_for_device_slot(entity_id, delay)
+            await self._async_send_calibration(calibration_value, entity_id)
+            self._last_call_ts[entity_id] = monotonic()
+        self._last_calibration[entity_id] = calibration_value
         _LOGGER.debug("Calibration value set to %s for real Thermostat %s", calibration_value, entity_id)
 
-    @property
-    def name(self):
-        if self._name is None:
-            _LOGGER.warning("Name property is None for FusionThermostat")
-        return self._name
-
-    @property
-    def unique_id(self):
-        if self._unique_id is None:
-            _LOGGER.warning("Unique ID property is None for FusionThermostat")
-        return self._unique_id
-
-    @property
-    def temperature_unit(self):
-        return self._temperature_unit
-
-    @property
-    def hvac_mode(self):
-        if self._hvac_mode is None:
-            _LOGGER.warning("HVAC mode is None for %s", self.name)
-        return self._hvac_mode
-
-    @property
-    def hvac_modes(self):
-        return self._hvac_modes
-
-    @property
-    def hvac_action(self):
-        return self._hvac_action
-
-    @property
-    def supported_features(self):
-        return self._supported_features
-
-    @property
-    def min_temp(self):
-        return self._min_temp
-
-    @property
-    def max_temp(self):
-        return self._max_temp
-
-    @property
-    def current_temperature(self):
-        if self._current_temperature is None:
-            _LOGGER.warning("Current temperature is None for %s", self.name)
-        return self._current_temperature
-
-    @property
-    def target_temperature(self):
-        if self._target_temperature is None:
-            _LOGGER.warning("Target temperature is None for %s", self.name)
-        return self._target_temperature
+    async def _async_send_calibration(self, calibration_value, entity_id) -> None:
+        self._local_temperature_calibration = calibration_value
+        await self.hass.services.async_call(
+            domain=self._calibration_domain, service="set_value",
+            service_data={"entity_id": self._calibration_entity_ids[entity_id], "value": calibration_value},
+        )
 
     @property
     def extra_state_attributes(self):